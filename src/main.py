@@ -26,6 +26,7 @@ from kivy.graphics import Color, Rectangle
 from kivy.uix.popup import Popup
 from kivymd.app import MDApp
 from datetime import datetime
+from functools import partial
 import tempfile
 from utils.config_manager import ConfigManager
 from views.settings_view import SettingsView
@@ -157,13 +158,13 @@ class PDFPreviewScreen(Screen):
         
         # Use proper MDButtons for view selection if KivyMD is available
         month_button = Button(text="Month View")
-        month_button.bind(on_press=lambda x: self.change_view('month'))
+        month_button.bind(on_press=partial(self._on_view_button, 'month'))
         
         week_button = Button(text="Week View")
-        week_button.bind(on_press=lambda x: self.change_view('week'))
+        week_button.bind(on_press=partial(self._on_view_button, 'week'))
         
         day_button = Button(text="Day View")
-        day_button.bind(on_press=lambda x: self.change_view('day'))
+        day_button.bind(on_press=partial(self._on_view_button, 'day'))
         
         view_layout.add_widget(month_button)
         view_layout.add_widget(week_button)
@@ -212,6 +213,8 @@ class PDFPreviewScreen(Screen):
         self.current_view = 'month'
         self.current_date = datetime.now()
         self.current_preview_path = None
+        self._temp_dir = None
+        self._renders_in_flight = 0
     
     def _update_bg_rect(self, instance, value):
         """Update the background rectangle position and size."""
@@ -229,12 +232,44 @@ class PDFPreviewScreen(Screen):
         """Navigate to settings screen."""
         safe_navigate('settings', transition_direction='left')
     
+    def on_leave(self, *args):
+        """Remove stale temporary preview files when leaving the screen."""
+        # A render still running owns a file in the directory, so leave cleanup to the next time
+        if not self._temp_dir or self._renders_in_flight:
+            return
+        try:
+            with os.scandir(self._temp_dir) as entries:
+                for entry in entries:
+                    # The shown preview stays, the image may reload it from disk
+                    if entry.path != self.current_preview_path:
+                        os.unlink(entry.path)
+        except OSError:
+            pass
+    
+    def remove_temp_files(self):
+        """Remove the temporary preview directory and everything in it."""
+        if not self._temp_dir:
+            return
+        try:
+            with os.scandir(self._temp_dir) as entries:
+                for entry in entries:
+                    os.unlink(entry.path)
+            os.rmdir(self._temp_dir)
+        except OSError:
+            pass
+        self._temp_dir = None
+        self.current_preview_path = None
+    
     def setup_preview(self, view_type, date):
         """Set up the preview with specified view type and date."""
         self.current_view = view_type
         self.current_date = date
         self.update_preview()
     
+    def _on_view_button(self, view_type, instance):
+        """Handle a press on one of the view type buttons."""
+        self.change_view(view_type)
+    
     def change_view(self, view_type):
         """Change the calendar view type."""
         self.current_view = view_type
@@ -248,11 +283,22 @@ class PDFPreviewScreen(Screen):
                 self.preview_image.source = ''
             
             # Remove any existing temporary preview file
-            if self.current_preview_path and os.path.exists(self.current_preview_path):
+            if self.current_preview_path:
                 try:
                     os.unlink(self.current_preview_path)
-                except:
+                except OSError:
                     pass
+                self.current_preview_path = None
+            
+            # Keep all preview files in one directory so they can be cleaned up together
+            if not self._temp_dir:
+                self._temp_dir = tempfile.mkdtemp(prefix='rm_agenda_preview_')
+            temp_dir = self._temp_dir
+            
+            # Read the on-screen preview size here, widget properties belong to the main thread
+            preview_size = None
+            if self.preview_area.get_root_window():
+                preview_size = tuple(self.preview_area.size)
             
             # Generate a new preview
             from utils.pdf_generator import generate_preview_image
@@ -266,7 +312,12 @@ class PDFPreviewScreen(Screen):
             # Generate the preview image in a separate thread to avoid blocking UI
             def generate_preview_thread():
                 try:
-                    preview_path = generate_preview_image(self.current_view, self.current_date)
+                    preview_path = generate_preview_image(
+                        self.current_view,
+                        self.current_date,
+                        output_dir=temp_dir,
+                        max_size=preview_size
+                    )
                     
                     if preview_path and os.path.exists(preview_path):
                         self.current_preview_path = preview_path
@@ -297,9 +348,13 @@ class PDFPreviewScreen(Screen):
                         self.preview_area.add_widget(self.preview_label)
                     
                     Clock.schedule_once(show_exception, 0)
+                finally:
+                    # Scheduled after the UI update, so the file is shown before cleanup may touch it
+                    Clock.schedule_once(self._on_render_finished, 0)
             
             # Start the preview generation in a separate thread
             import threading
+            self._renders_in_flight += 1
             preview_thread = threading.Thread(target=generate_preview_thread)
             preview_thread.daemon = True
             preview_thread.start()
@@ -310,6 +365,10 @@ class PDFPreviewScreen(Screen):
             self.preview_area.clear_widgets()
             self.preview_area.add_widget(self.preview_label)
     
+    def _on_render_finished(self, dt):
+        """Note that a preview render has finished and its file is safe to clean up."""
+        self._renders_in_flight -= 1
+    
     def generate_pdf(self, instance):
         """Generate the PDF file."""
         from utils.pdf_generator import generate_calendar_pdf
@@ -483,6 +542,10 @@ class RemarkableAgendaApp(MDApp):
         
         return self.screen_manager
     
+    def on_stop(self):
+        """Remove the temporary preview files when the app closes."""
+        self.pdf_preview.remove_temp_files()
+    
     def on_settings_changed(self):
         """Handle settings changes from the settings screen."""
         # Reload all settings
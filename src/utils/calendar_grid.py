@@ -0,0 +1,23 @@
+"""
+Month grid helper for the reMarkable Agenda Generator.
+Builds the day-of-month layout shared by the PDF and preview renderers.
+"""
+import calendar
+from functools import lru_cache
+
+@lru_cache(maxsize=32)
+def month_grid(year, month, monday_first=False):
+    """
+    Get the weeks of a month as rows of day numbers.
+    
+    Args:
+        year (int): Year of the month
+        month (int): Month number (1-12)
+        monday_first (bool): If True, weeks start on Monday, otherwise on Sunday
+    
+    Returns:
+        tuple: One 7-tuple per week; days outside the month are 0
+    """
+    first_weekday = calendar.MONDAY if monday_first else calendar.SUNDAY
+    weeks = calendar.Calendar(first_weekday).monthdayscalendar(year, month)
+    return tuple(tuple(week) for week in weeks)
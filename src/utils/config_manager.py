@@ -27,6 +27,9 @@ class ConfigManager:
             }
         }
         
+        # Modification time of the config file when it was last read or written
+        self._loaded_mtime = None
+        
         # Load existing configuration if available
         self.load_config()
     
@@ -52,6 +55,13 @@ class ConfigManager:
                         
                     if loaded_config.get("display"):
                         self.config["display"].update(loaded_config.get("display", {}))
+                
+                # Older config files may hold the display flags as "True"/"False" strings
+                display = self.config["display"]
+                for key in ("use_24h_time", "monday_first"):
+                    display[key] = str(display[key]).lower() == 'true'
+                
+                self._loaded_mtime = os.path.getmtime(config_file)
             except Exception as e:
                 print(f"Error loading config: {e}")
     
@@ -68,6 +78,7 @@ class ConfigManager:
         try:
             with open(config_file, 'w') as f:
                 json.dump(self.config, f, indent=2)
+            self._loaded_mtime = os.path.getmtime(config_file)
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -79,6 +90,23 @@ class ConfigManager:
             return str(self.config[section][key])
         return None
     
+    def get_snapshot(self):
+        """
+        Get all settings in one read.
+        
+        Returns the live configuration dict by reference, so callers must not modify it.
+        The file is only re-read if it changed since it was last loaded or saved.
+        """
+        config_file = os.path.join(self._get_config_dir(), "config.json")
+        try:
+            mtime = os.path.getmtime(config_file)
+        except OSError:
+            return self.config
+        
+        if mtime != self._loaded_mtime:
+            self.load_config()
+        return self.config
+    
     def set_weather_settings(self, api_key, location):
         """Set weather API settings."""
         self.config["weather"]["api_key"] = api_key
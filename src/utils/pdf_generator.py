@@ -3,7 +3,6 @@ PDF generator for the reMarkable Agenda Generator.
 Creates calendar PDFs optimized for reMarkable tablets.
 """
 import os
-import calendar
 import tempfile
 from datetime import datetime, timedelta
 from reportlab.lib.pagesizes import A4
@@ -14,6 +13,7 @@ from reportlab.graphics.shapes import Drawing
 from PIL import Image, ImageDraw, ImageFont
 from kivymd.app import MDApp
 import io
+from utils.calendar_grid import month_grid
 
 def generate_calendar_pdf(view_type, date, output_path, for_preview=False):
     """
@@ -62,7 +62,7 @@ def generate_calendar_pdf(view_type, date, output_path, for_preview=False):
     c.save()
     return output_path
 
-def generate_preview_image(view_type, date, dpi=100):
+def generate_preview_image(view_type, date, dpi=100, output_dir=None, max_size=None):
     """
     Generate a preview image of the calendar using a cross-platform approach.
     
@@ -70,58 +70,19 @@ def generate_preview_image(view_type, date, dpi=100):
         view_type (str): 'month', 'week', or 'day'
         date (datetime): Date to use for the calendar
         dpi (int): Resolution for the preview image
+        output_dir (str, optional): Directory for the image file (system temp dir if None)
+        max_size (tuple, optional): (width, height) in pixels the preview is displayed at;
+            larger images are downscaled to fit before saving
     
     Returns:
         str: Path to the generated preview image
     """
-    # Get application settings
-    app = MDApp.get_running_app()
-    use_24h_time = getattr(app, 'use_24h_time', False) 
-    monday_first = getattr(app, 'monday_first', False)
-    
     # Create a temporary image file
-    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_img:
+    with tempfile.NamedTemporaryFile(suffix='.png', dir=output_dir, delete=False) as tmp_img:
         temp_img_path = tmp_img.name
     
     try:
-        # Use direct drawing approach for cross-platform compatibility
-        # Calculate dimensions similar to reportlab (but scaled down for preview)
-        scale_factor = 0.33  # Scale down for preview
-        width, height = int(1404 * scale_factor), int(1872 * scale_factor)
-        
-        # Create a blank white image
-        image = Image.new('RGB', (width, height), color='white')
-        draw = ImageDraw.Draw(image)
-        
-        # Try to load a font, fall back to default if not available
-        try:
-            # Try to use a system font
-            font_title = ImageFont.truetype("Arial", 24)
-            font_regular = ImageFont.truetype("Arial", 12)
-            font_bold = ImageFont.truetype("Arial Bold", 14)
-        except:
-            # Fall back to default font
-            font_title = ImageFont.load_default()
-            font_regular = ImageFont.load_default()
-            font_bold = ImageFont.load_default()
-        
-        # Draw title
-        if view_type == 'month':
-            title = f"{date.strftime('%B %Y')}"
-            draw.text((30, 30), title, fill='black', font=font_title)
-            _draw_month_view_image(draw, date, width, height, font_regular, font_bold, monday_first)
-        elif view_type == 'week':
-            # Adjust start of week based on settings
-            first_day_offset = date.weekday() if monday_first else (date.weekday() + 1) % 7
-            start_of_week = date - timedelta(days=first_day_offset)
-            end_of_week = start_of_week + timedelta(days=6)
-            title = f"Week of {start_of_week.strftime('%b %d')} - {end_of_week.strftime('%b %d, %Y')}"
-            draw.text((30, 30), title, fill='black', font=font_title)
-            _draw_week_view_image(draw, date, width, height, font_regular, font_bold, monday_first, use_24h_time)
-        elif view_type == 'day':
-            title = f"{date.strftime('%A, %B %d, %Y')}"
-            draw.text((30, 30), title, fill='black', font=font_title)
-            _draw_day_view_image(draw, date, width, height, font_regular, font_bold, use_24h_time)
+        image = render_preview_image(view_type, date, max_size)
         
         # Save the image
         image.save(temp_img_path)
@@ -133,6 +94,69 @@ def generate_preview_image(view_type, date, dpi=100):
     
     return temp_img_path
 
+def render_preview_image(view_type, date, max_size=None):
+    """
+    Draw a preview of the calendar page into an in-memory image.
+    
+    Args:
+        view_type (str): 'month', 'week', or 'day'
+        date (datetime): Date to use for the calendar
+        max_size (tuple, optional): (width, height) in pixels the preview is displayed at;
+            larger images are downscaled to fit
+    
+    Returns:
+        PIL.Image.Image: The rendered preview
+    """
+    # Get application settings
+    app = MDApp.get_running_app()
+    use_24h_time = getattr(app, 'use_24h_time', False) 
+    monday_first = getattr(app, 'monday_first', False)
+    
+    # Use direct drawing approach for cross-platform compatibility
+    # Calculate dimensions similar to reportlab (but scaled down for preview)
+    scale_factor = 0.33  # Scale down for preview
+    width, height = int(1404 * scale_factor), int(1872 * scale_factor)
+    
+    # Create a blank white image
+    image = Image.new('RGB', (width, height), color='white')
+    draw = ImageDraw.Draw(image)
+    
+    # Try to load a font, fall back to default if not available
+    try:
+        # Try to use a system font
+        font_title = ImageFont.truetype("Arial", 24)
+        font_regular = ImageFont.truetype("Arial", 12)
+        font_bold = ImageFont.truetype("Arial Bold", 14)
+    except:
+        # Fall back to default font
+        font_title = ImageFont.load_default()
+        font_regular = ImageFont.load_default()
+        font_bold = ImageFont.load_default()
+    
+    # Draw title
+    if view_type == 'month':
+        title = f"{date.strftime('%B %Y')}"
+        draw.text((30, 30), title, fill='black', font=font_title)
+        _draw_month_view_image(draw, date, width, height, font_regular, font_bold, monday_first)
+    elif view_type == 'week':
+        # Adjust start of week based on settings
+        first_day_offset = date.weekday() if monday_first else (date.weekday() + 1) % 7
+        start_of_week = date - timedelta(days=first_day_offset)
+        end_of_week = start_of_week + timedelta(days=6)
+        title = f"Week of {start_of_week.strftime('%b %d')} - {end_of_week.strftime('%b %d, %Y')}"
+        draw.text((30, 30), title, fill='black', font=font_title)
+        _draw_week_view_image(draw, date, width, height, font_regular, font_bold, monday_first, use_24h_time)
+    elif view_type == 'day':
+        title = f"{date.strftime('%A, %B %d, %Y')}"
+        draw.text((30, 30), title, fill='black', font=font_title)
+        _draw_day_view_image(draw, date, width, height, font_regular, font_bold, use_24h_time)
+    
+    # Downscale to the on-screen size so no oversized texture gets uploaded
+    if max_size and max_size[0] > 0 and max_size[1] > 0:
+        image.thumbnail((int(max_size[0]), int(max_size[1])), Image.LANCZOS)
+    
+    return image
+
 def _format_time(hour, use_24h=False):
     """Format hour based on 24-hour or 12-hour preference."""
     if use_24h:
@@ -153,20 +177,8 @@ def _get_weekday_names(monday_first=False):
 
 def _draw_month_view_image(draw, date, width, height, font_regular, font_bold, monday_first=False):
     """Draw a month view calendar on a PIL Image."""
-    # Get calendar for the current month
-    cal = calendar.monthcalendar(date.year, date.month)
-    
-    # Adjust calendar if week starts on Sunday
-    if not monday_first:
-        # Create a new calendar with Sunday as first day
-        cal_sunday_first = []
-        for week in cal:
-            # Shift days: [Mon, Tue, Wed, Thu, Fri, Sat, Sun] -> [Sun, Mon, Tue, Wed, Thu, Fri, Sat]
-            new_week = [0] + week[:-1] if len(week) == 7 else [0] * 7
-            if week[6] != 0:  # If Sunday has a value
-                new_week[0] = week[6]  # Move Sunday to the first position
-            cal_sunday_first.append(new_week)
-        cal = cal_sunday_first
+    # Get calendar for the current month, starting weeks on the configured day
+    cal = month_grid(date.year, date.month, monday_first)
     
     # Define grid parameters
     margin = 20
@@ -285,20 +297,8 @@ def _draw_day_view_image(draw, date, width, height, font_regular, font_bold, use
 
 def _draw_month_view(c, date, supports_color, dimensions, monday_first=False):
     """Draw a month view calendar."""
-    # Get calendar for the current month
-    cal = calendar.monthcalendar(date.year, date.month)
-    
-    # Adjust calendar if week starts on Sunday
-    if not monday_first:
-        # Create a new calendar with Sunday as first day
-        cal_sunday_first = []
-        for week in cal:
-            # Shift days: [Mon, Tue, Wed, Thu, Fri, Sat, Sun] -> [Sun, Mon, Tue, Wed, Thu, Fri, Sat]
-            new_week = [0] + week[:-1] if len(week) == 7 else [0] * 7
-            if week[6] != 0:  # If Sunday has a value
-                new_week[0] = week[6]  # Move Sunday to the first position
-            cal_sunday_first.append(new_week)
-        cal = cal_sunday_first
+    # Get calendar for the current month, starting weeks on the configured day
+    cal = month_grid(date.year, date.month, monday_first)
     
     # Define grid parameters
     width, height = dimensions
@@ -0,0 +1,26 @@
+"""
+Helper widgets shared by the application's screens.
+"""
+from kivy.uix.label import Label
+
+from utils.theme_manager import ThemeManager
+
+class SafeLabel(Label):
+    """
+    Label that accepts any text value and aligns it within its own bounds.
+
+    Plain Labels reject non-string text and ignore halign/valign unless text_size
+    is set, so this coerces the text and keeps text_size tied to the widget size.
+    """
+
+    def __init__(self, **kwargs):
+        text = kwargs.get('text')
+        kwargs['text'] = '' if text is None else str(text)
+        kwargs.setdefault('color', ThemeManager.COLORS['text_primary'])
+        kwargs.setdefault('valign', 'middle')
+        super(SafeLabel, self).__init__(**kwargs)
+        self.fbind('size', self._update_text_size)
+
+    def _update_text_size(self, instance, size):
+        """Wrap and align the text within the label's current size."""
+        self.text_size = size
@@ -1,29 +1,98 @@
 """
 PDF preview and generation screen for the reMarkable Agenda Generator.
 """
+import hashlib
+import io
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from functools import partial
+from functools import wraps
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.image import Image
+from kivy.core.image import Image as CoreImage
 from kivy.uix.dropdown import DropDown
 from kivy.uix.popup import Popup
 from kivy.metrics import dp
 from kivy.clock import Clock
 from kivy.app import App
-from plyer import filechooser
 from kivy.uix.togglebutton import ToggleButton
 from kivy.uix.textinput import TextInput
 
-from utils.pdf_generator import generate_calendar_pdf
 from utils.ui_helpers import SafeLabel
 from utils.icon_helper import get_icon_button
 from utils.setup_helper import safe_navigate
 from utils.theme_manager import ThemeManager
 
+# Worker threads for PDF generation, keeping ReportLab work off the UI thread
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Maximum number of preview PDFs kept on disk
+_PREVIEW_CACHE_SIZE = 16
+
+# Seconds to wait after the last option change before regenerating the preview
+_PREVIEW_DEBOUNCE = 0.25
+
+# Maximum number of formatted date labels kept
+_LABEL_CACHE_SIZE = 64
+
+# Display names for each view type
+_VIEW_TYPE_TEXTS = {
+    'month': 'Monthly Calendar',
+    'week': 'Weekly Calendar',
+    'day': 'Daily Calendar'
+}
+
+# Labels for the calendar component toggles
+_COMPONENT_TEXTS = {
+    'month': 'Include Monthly View',
+    'week': 'Include Weekly View',
+    'day': 'Include Daily View'
+}
+
+# Date steps used by the navigation buttons
+_ONE_DAY = timedelta(days=1)
+_SIX_DAYS = timedelta(days=6)
+_ONE_WEEK = timedelta(days=7)
+_NAV_STEPS = {'week': _ONE_WEEK, 'day': _ONE_DAY}
+
+def _safe_handler(handler):
+    """Wrap a UI event handler so errors are logged instead of propagating."""
+    @wraps(handler)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return handler(self, *args, **kwargs)
+        except Exception as e:
+            print(f"Error in {handler.__name__}: {e}")
+    return wrapper
+
+def _render_preview(view_type, date, pdf_path):
+    """
+    Generate a preview PDF and a PNG of its page; runs on a worker thread.
+    
+    Returns:
+        tuple: (pdf_path, png_data)
+    """
+    from utils.pdf_generator import generate_calendar_pdf, render_preview_image
+    
+    generate_calendar_pdf(view_type, date, pdf_path, for_preview=True)
+    
+    # Encode in memory so the main thread can turn it into a texture without touching disk
+    buffer = io.BytesIO()
+    render_preview_image(view_type, date).save(buffer, format='png')
+    return pdf_path, buffer.getvalue()
+
+def _step_date(view_type, date, step):
+    """Move a date by a number of months, weeks or days depending on the view type."""
+    if view_type == 'month':
+        # Months always land on the first day; divmod handles the year rollover
+        years, month_index = divmod(date.month - 1 + step, 12)
+        return date.replace(year=date.year + years, month=month_index + 1, day=1)
+    return date + step * _NAV_STEPS.get(view_type, _ONE_DAY)
+
 class PDFPreviewView(Screen):
     """PDF preview and generation screen."""
     
@@ -32,9 +101,48 @@ class PDFPreviewView(Screen):
         self.view_type = 'month'
         self.current_date = datetime.now()
         self.pdf_path = None
-        self.include_months = True
-        self.include_weeks = True
-        self.include_days = True
+        self._components = {'month': True, 'week': True, 'day': True}
+        
+        # Recently generated preview PDFs, keyed by view type, date and components
+        self._preview_cache = OrderedDict()
+        self._last_preview_key = None
+        
+        # Resolve preview paths once instead of probing the filesystem per preview
+        self._preview_dir = os.path.join(os.getcwd(), "output")
+        os.makedirs(self._preview_dir, exist_ok=True)
+        self._placeholder_image = os.path.join("assets", "images", "preview_placeholder.png")
+        # Decode the placeholder once so failures only swap textures
+        self._placeholder_texture = None
+        if os.path.exists(self._placeholder_image):
+            self._placeholder_texture = CoreImage(self._placeholder_image).texture
+        
+        # Preview PDFs are rendered off the UI thread; renders still running are kept by key
+        # so asking for the same preview again waits on the existing render
+        self._pending_future = None
+        self._inflight = {}
+        
+        # Formatted date label text, keyed by view type and date
+        self._label_cache = {}
+        
+        # Neighbouring preview rendered ahead of time while the user navigates
+        self._prefetch_future = None
+        self._prefetch_step = 0
+        
+        # Coalesce bursts of toggles/navigation into a single preview regeneration
+        self._preview_trigger = Clock.create_trigger(lambda dt: self.generate_preview(), _PREVIEW_DEBOUNCE)
+        
+        # Running app, looked up on first use
+        self._app = None
+        
+        # Set once _init_ui has built the widgets
+        self._ui_ready = False
+        self._loading_popup = None
+        
+        # Save result popups are built on first use and reused afterwards
+        self._save_success_popup = None
+        self._save_error_popup = None
+        self._error_popup = None
+        self._saved_path = None
         
         # Initialize UI
         self.layout = BoxLayout(orientation='horizontal', padding=dp(10), spacing=dp(15))
@@ -47,24 +155,25 @@ class PDFPreviewView(Screen):
         self.right_panel = BoxLayout(orientation='vertical', spacing=dp(10),
                                     size_hint_x=0.7)
         
-        # Add panels to main layout
-        self.layout.add_widget(self.left_panel)
-        self.layout.add_widget(self.right_panel)
-        
         # Initialize the dropdown
         self._init_dropdown()
         
-        # Add the layout to the screen with a delayed initialization
+        # Fill the panels while they are detached, then attach the finished tree in one go
+        self._init_ui()
+        self.layout.add_widget(self.left_panel)
+        self.layout.add_widget(self.right_panel)
         self.add_widget(self.layout)
-        Clock.schedule_once(self._init_ui, 0.1)
     
-    def _init_ui(self, dt):
-        """Initialize the UI with a delay to prevent layout errors."""
+    @property
+    def app(self):
+        """The running app, cached after the first lookup."""
+        if self._app is None:
+            self._app = App.get_running_app()
+        return self._app
+    
+    def _init_ui(self):
+        """Build the UI widgets; later updates only change their properties."""
         try:
-            # Clear existing widgets
-            self.left_panel.clear_widgets()
-            self.right_panel.clear_widgets()
-            
             # Top controls for the left panel
             self.top_bar = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(100))
             
@@ -145,12 +254,14 @@ class PDFPreviewView(Screen):
             
             # Preview image
             self.preview_image = Image(
-                source="assets/images/preview_placeholder.png",
+                source=self._placeholder_image,
                 allow_stretch=True,
                 keep_ratio=True
             )
             self.right_panel.add_widget(self.preview_image)
             
+            self._ui_ready = True
+            
         except Exception as e:
             print(f"Error initializing UI: {e}")
     
@@ -161,7 +272,7 @@ class PDFPreviewView(Screen):
         # Previous button with icon
         self.prev_btn = get_icon_button(
             'arrow-left', 
-            callback=lambda x: Clock.schedule_once(lambda dt: self.previous_date(), 0.1),
+            callback=self._on_prev,
             tooltip="Previous Month",
             size_hint_x=0.2
         )
@@ -176,7 +287,7 @@ class PDFPreviewView(Screen):
         # Next button with icon
         self.next_btn = get_icon_button(
             'arrow-right', 
-            callback=lambda x: Clock.schedule_once(lambda dt: self.next_date(), 0.1),
+            callback=self._on_next,
             tooltip="Next Month",
             size_hint_x=0.2
         )
@@ -210,32 +321,18 @@ class PDFPreviewView(Screen):
         )
         self.left_panel.add_widget(self.components_label)
         
-        # Month option
-        self.month_option_row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40))
-        self.month_option_row.add_widget(SafeLabel(text="Include Monthly View", size_hint_x=0.7))
-        
-        self.month_toggle = ToggleButton(text="Yes", state="down", size_hint_x=0.3)
-        self.month_toggle.bind(state=self._safe_month_toggle)
-        self.month_option_row.add_widget(self.month_toggle)
-        self.left_panel.add_widget(self.month_option_row)
-        
-        # Week option
-        self.week_option_row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40))
-        self.week_option_row.add_widget(SafeLabel(text="Include Weekly View", size_hint_x=0.7))
-        
-        self.week_toggle = ToggleButton(text="Yes", state="down", size_hint_x=0.3)
-        self.week_toggle.bind(state=self._safe_week_toggle)
-        self.week_option_row.add_widget(self.week_toggle)
-        self.left_panel.add_widget(self.week_option_row)
-        
-        # Day option
-        self.day_option_row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40))
-        self.day_option_row.add_widget(SafeLabel(text="Include Daily View", size_hint_x=0.7))
-        
-        self.day_toggle = ToggleButton(text="Yes", state="down", size_hint_x=0.3)
-        self.day_toggle.bind(state=self._safe_day_toggle)
-        self.day_option_row.add_widget(self.day_toggle)
-        self.left_panel.add_widget(self.day_option_row)
+        # One row per component; the toggles share a handler keyed by component
+        self.component_toggles = {}
+        for component, text in _COMPONENT_TEXTS.items():
+            row = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40))
+            row.add_widget(SafeLabel(text=text, size_hint_x=0.7))
+            
+            toggle = ToggleButton(text="Yes", state="down", size_hint_x=0.3)
+            toggle.component = component
+            toggle.bind(state=self._safe_component_toggle)
+            row.add_widget(toggle)
+            self.component_toggles[component] = toggle
+            self.left_panel.add_widget(row)
         
         # Add some spacing
         self.left_panel.add_widget(Label())
@@ -243,33 +340,24 @@ class PDFPreviewView(Screen):
     def _init_dropdown(self):
         """Initialize view type dropdown."""
         self.view_type_dropdown = DropDown()
-        view_types = [
-            ('Monthly Calendar', 'month'),
-            ('Weekly Calendar', 'week'),
-            ('Daily Calendar', 'day')
-        ]
-        
-        for name, view_type in view_types:
-            btn = Button(text=name, size_hint_y=None, height=dp(44))
+        
+        # DropDown already holds its items in a single GridLayout container
+        item_height = dp(44)
+        for view_type, name in _VIEW_TYPE_TEXTS.items():
+            btn = Button(text=name, size_hint_y=None, height=item_height)
             btn.view_type = view_type
-            # Use a partial function to safely bind the button
-            btn.bind(on_release=partial(self._on_dropdown_select, view_type=view_type))
+            btn.bind(on_release=self._on_dropdown_select)
             self.view_type_dropdown.add_widget(btn)
     
-    def _on_dropdown_select(self, instance, view_type):
-        """Handle dropdown item selection with direct view_type parameter."""
+    def _on_dropdown_select(self, instance):
+        """Handle dropdown item selection using the button's view_type."""
         self.view_type_dropdown.dismiss()
-        Clock.schedule_once(lambda dt: self._safe_view_type_select(view_type), 0.1)
+        self._safe_view_type_select(instance.view_type)
     
     def update_view_type_button(self):
         """Update the view type button text based on the current selection."""
-        view_type_names = {
-            'month': 'Monthly Calendar',
-            'week': 'Weekly Calendar',
-            'day': 'Daily Calendar'
-        }
-        if hasattr(self, 'view_type_btn'):
-            self.view_type_btn.text = f"Template: {view_type_names.get(self.view_type, 'Unknown')}"
+        if self._ui_ready:
+            self.view_type_btn.text = f"Template: {_VIEW_TYPE_TEXTS.get(self.view_type, 'Unknown')}"
     
     def go_back_to_tablet_selection(self, instance):
         """Return to the tablet selection screen."""
@@ -279,163 +367,271 @@ class PDFPreviewView(Screen):
         """Open the settings screen."""
         safe_navigate('settings', transition_direction='left')
     
+    def _on_prev(self, instance):
+        """Handle a press on the previous button."""
+        self.previous_date()
+    
+    def _on_next(self, instance):
+        """Handle a press on the next button."""
+        self.next_date()
+    
     def previous_date(self):
         """Navigate to the previous month/week/day."""
-        if self.view_type == 'month':
-            # Go to previous month
-            if self.current_date.month == 1:
-                self.current_date = self.current_date.replace(year=self.current_date.year-1, month=12, day=1)
-            else:
-                self.current_date = self.current_date.replace(month=self.current_date.month-1, day=1)
-        elif self.view_type == 'week':
-            # Go to previous week
-            self.current_date -= timedelta(days=7)
-        else:
-            # Go to previous day
-            self.current_date -= timedelta(days=1)
-            
+        self.current_date = _step_date(self.view_type, self.current_date, -1)
+        self._prefetch_step = -1
+        
         self.update_date_display()
-        self.generate_preview()
+        self._schedule_preview()
     
     def next_date(self):
         """Navigate to the next month/week/day."""
-        if self.view_type == 'month':
-            # Go to next month
-            if self.current_date.month == 12:
-                self.current_date = self.current_date.replace(year=self.current_date.year+1, month=1, day=1)
-            else:
-                self.current_date = self.current_date.replace(month=self.current_date.month+1, day=1)
-        elif self.view_type == 'week':
-            # Go to next week
-            self.current_date += timedelta(days=7)
-        else:
-            # Go to next day
-            self.current_date += timedelta(days=1)
-            
+        self.current_date = _step_date(self.view_type, self.current_date, 1)
+        self._prefetch_step = 1
+        
         self.update_date_display()
-        self.generate_preview()
+        self._schedule_preview()
     
     def update_date_display(self):
         """Update the date label based on the current view type and date."""
-        if self.view_type == 'month':
-            self.date_label.text = self.current_date.strftime("%B %Y")
-        elif self.view_type == 'week':
-            # Calculate start and end of week
-            start_of_week = self.current_date - timedelta(days=self.current_date.weekday())
-            end_of_week = start_of_week + timedelta(days=6)
-            self.date_label.text = f"{start_of_week.strftime('%b %d')} - {end_of_week.strftime('%b %d, %Y')}"
-        else:
-            self.date_label.text = self.current_date.strftime("%A, %b %d, %Y")
+        key = (self.view_type, self.current_date.toordinal())
+        text = self._label_cache.get(key)
+        if text is None:
+            if self.view_type == 'month':
+                text = self.current_date.strftime("%B %Y")
+            elif self.view_type == 'week':
+                # Calculate start and end of week
+                start_of_week = self.current_date - timedelta(days=self.current_date.weekday())
+                end_of_week = start_of_week + _SIX_DAYS
+                text = f"{start_of_week.strftime('%b %d')} - {end_of_week.strftime('%b %d, %Y')}"
+            else:
+                text = self.current_date.strftime("%A, %b %d, %Y")
+            
+            # Drop the oldest label once the cache is full
+            if len(self._label_cache) >= _LABEL_CACHE_SIZE:
+                del self._label_cache[next(iter(self._label_cache))]
+            self._label_cache[key] = text
+        
+        self.date_label.text = text
+    
+    def _schedule_preview(self):
+        """Regenerate the preview once the user stops changing options."""
+        # Re-arming restarts the debounce window so only the last change renders
+        self._preview_trigger.cancel()
+        self._preview_trigger()
+    
+    def _preview_key(self, date):
+        """Build the cache key for a preview of the given date."""
+        app = self.app
+        return (
+            self.view_type,
+            date.toordinal(),
+            *self._components.values(),
+            app.supports_color,
+            tuple(app.dimensions),
+            app.monday_first,
+            app.use_24h_time
+        )
+    
+    def _submit_preview(self, date, key):
+        """Start rendering a preview PDF on the worker threads, or join the render already running for it."""
+        future = self._inflight.get(key)
+        if future is not None and not future.cancelled():
+            return future
+        
+        future = self._start_render(date, key)
+        self._inflight[key] = future
+        future.add_done_callback(
+            lambda f: Clock.schedule_once(lambda dt: self._forget_render(f, key), 0)
+        )
+        return future
+    
+    def _forget_render(self, future, key):
+        """Stop tracking a finished render so the next request for its key starts fresh."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+    
+    def _start_render(self, date, key):
+        """Submit a preview render to the worker threads."""
+        # Hash the whole key so every distinct preview, device settings included, gets its own file
+        digest = hashlib.md5(repr(key).encode()).hexdigest()[:12]
+        filename = f"preview_{self.view_type}_{date.strftime('%Y%m%d')}_{digest}.pdf"
+        
+        return _PDF_EXECUTOR.submit(
+            _render_preview,
+            self.view_type,
+            date,
+            os.path.join(self._preview_dir, filename)
+        )
     
     def generate_preview(self):
         """Generate a preview of the PDF."""
+        # Skip the work entirely if nothing changed since the last preview
+        key = self._preview_key(self.current_date)
+        if key == self._last_preview_key:
+            # A render still running for an earlier change must not replace what is shown
+            self._drop_pending_preview()
+            return
+        
         try:
-            app = App.get_running_app()
-            
-            # Generate the PDF
-            output_dir = os.path.join(os.getcwd(), "output")
-            
-            # Create components configuration based on toggle buttons
-            components = {
-                'month': self.include_months,
-                'week': self.include_weeks,
-                'day': self.include_days
-            }
-            
-            dimensions = app.dimensions
-            supports_color = app.supports_color
-            
-            # Call the PDF generator
-            self.pdf_path = generate_calendar_pdf(
-                self.view_type,
-                self.current_date,
-                output_dir,
-                dimensions,
-                components,
-                supports_color
+            entry = self._preview_cache.get(key)
+            if entry:
+                self._drop_pending_preview()
+                self._preview_cache.move_to_end(key)
+                self._show_preview(key, entry)
+                return
+            
+            # A newer request makes any queued render obsolete
+            self._drop_pending_preview()
+            
+            # Call the PDF generator on the worker thread so the UI keeps drawing; a render of
+            # this exact preview that is already running, such as a prefetch, is reused
+            future = self._submit_preview(self.current_date, key)
+            
+            self._pending_future = future
+            future.add_done_callback(
+                lambda f: Clock.schedule_once(lambda dt: self._on_preview_ready(f, key), 0)
             )
-            
-            # Show a preview of the first page
-            if self.pdf_path and os.path.exists(self.pdf_path):
-                # TODO: Generate an image preview of the PDF
-                # For now, just show a placeholder
-                self.preview_image.source = "assets/images/preview_placeholder.png"
-                self.preview_image.reload()
                 
         except Exception as e:
             print(f"Error generating preview: {e}")
             # Show a placeholder
-            self.preview_image.source = "assets/images/preview_placeholder.png"
-            self.preview_image.reload()
+            if self._placeholder_texture:
+                self.preview_image.texture = self._placeholder_texture
+    
+    def _drop_pending_preview(self):
+        """Stop waiting on the current render so its result is cached but not shown."""
+        if self._pending_future:
+            self._pending_future.cancel()
+            self._pending_future = None
+    
+    def _prefetch_preview(self, date):
+        """Speculatively render the preview the user is likely to view next."""
+        # Only one prefetch at a time so scrubbing doesn't flood the workers
+        if self._prefetch_future and not self._prefetch_future.done():
+            return
+        
+        key = self._preview_key(date)
+        if key in self._preview_cache:
+            return
+        
+        future = self._prefetch_future = self._submit_preview(date, key)
+        future.add_done_callback(
+            lambda f: Clock.schedule_once(lambda dt: self._on_prefetch_ready(f, key), 0)
+        )
+    
+    def _on_prefetch_ready(self, future, key):
+        """Store a finished prefetch in the preview cache."""
+        # A prefetch joined by a shown preview may already have been cached by its callback
+        if future.cancelled() or future.exception() is not None or key in self._preview_cache:
+            return
+        self._cache_preview(key, future.result())
+    
+    def _cache_preview(self, key, result):
+        """Remember a rendered preview, evicting the least recently used one."""
+        pdf_path, png_data = result
+        
+        # Textures must be created on the main thread, so decode here rather than in the worker
+        texture = CoreImage(io.BytesIO(png_data), ext='png').texture
+        entry = (pdf_path, texture)
+        
+        self._preview_cache[key] = entry
+        self._preview_cache.move_to_end(key)
+        if len(self._preview_cache) > _PREVIEW_CACHE_SIZE:
+            _, (evicted_path, _) = self._preview_cache.popitem(last=False)
+            try:
+                os.remove(evicted_path)
+            except OSError:
+                pass
+        return entry
+    
+    def _on_preview_ready(self, future, key):
+        """Handle a finished preview render on the main thread."""
+        if future.cancelled():
+            return
+        
+        is_current = future is self._pending_future
+        if is_current:
+            self._pending_future = None
+        
+        try:
+            # An adopted prefetch may already have been cached by its own callback
+            entry = self._preview_cache.get(key) or self._cache_preview(key, future.result())
+        except Exception as e:
+            print(f"Error generating preview: {e}")
+            if is_current and self._placeholder_texture:
+                self.preview_image.texture = self._placeholder_texture
+            return
+        
+        # A render that was superseded while running is cached but not shown
+        if is_current:
+            self._show_preview(key, entry)
+    
+    def _show_preview(self, key, entry):
+        """Show a cached preview and remember its PDF."""
+        self.pdf_path, texture = entry
+        self._last_preview_key = key
+        
+        # Show the rendered first page
+        self.preview_image.texture = texture
+        
+        # After navigating, get the next page in the same direction ready; other changes don't prefetch
+        if self._prefetch_step:
+            self._prefetch_preview(_step_date(self.view_type, self.current_date, self._prefetch_step))
+            self._prefetch_step = 0
     
     def generate_pdf(self, *args):
         """Generate and save the PDF."""
         try:
+            # Imported here so a missing PDF backend is reported like any other failure
+            from utils.pdf_generator import generate_calendar_pdf
+            
             # Show a loading indicator
             self._show_loading_popup("Generating PDF...")
             
-            # Get app instance
-            app = App.get_running_app()
-            
             # Create a unique filename based on the current date and view type
             filename = f"remarkable_calendar_{self.view_type}_{self.current_date.strftime('%Y%m%d')}.pdf"
             output_path = os.path.join("output", filename)
             
-            # Schedule the actual generation with a short delay to allow loading popup to appear
-            Clock.schedule_once(lambda dt: self._perform_pdf_generation(output_path, app), 0.1)
+            # Generate on a worker thread and handle the result back on the main thread
+            future = _PDF_EXECUTOR.submit(
+                generate_calendar_pdf,
+                self.view_type,
+                self.current_date,
+                output_path
+            )
+            future.add_done_callback(
+                lambda f: Clock.schedule_once(lambda dt: self._on_pdf_done(f, output_path), 0)
+            )
         except Exception as e:
             print(f"Error initiating PDF generation: {e}")
-            # Show error popup
-            popup = Popup(
-                title='Error',
-                content=Label(text=f"Could not generate PDF: {str(e)}"),
-                size_hint=(None, None),
-                size=(dp(400), dp(200))
-            )
-            popup.open()
+            self._show_error_popup(f"Could not generate PDF: {str(e)}")
     
-    def _perform_pdf_generation(self, output_path, app):
-        """Perform the actual PDF generation in a separate function."""
-        try:
-            # Determine which components to include
-            include = {
-                'month': self.include_months,
-                'week': self.include_weeks,
-                'day': self.include_days
-            }
-            
-            # Generate the PDF
-            generate_calendar_pdf(
-                output_path,
-                self.current_date,
-                supports_color=app.supports_color,
-                include=include,
-                dimensions=app.dimensions,
-                view_type=self.view_type
-            )
-            
-            # Dismiss loading popup
-            if hasattr(self, '_loading_popup') and self._loading_popup:
-                self._loading_popup.dismiss()
-                self._loading_popup = None
-            
+    def _on_pdf_done(self, future, output_path):
+        """Handle a finished PDF generation on the main thread."""
+        # Dismiss loading popup
+        if self._loading_popup:
+            self._loading_popup.dismiss()
+            self._loading_popup = None
+        
+        error = future.exception()
+        if error is None:
             # Show success popup
             self.show_save_success(output_path)
-        except Exception as e:
-            print(f"Error generating PDF: {e}")
-            # Dismiss loading popup
-            if hasattr(self, '_loading_popup') and self._loading_popup:
-                self._loading_popup.dismiss()
-                self._loading_popup = None
-                
-            # Show error popup
-            popup = Popup(
+        else:
+            print(f"Error generating PDF: {error}")
+            self._show_error_popup(f"Could not generate PDF: {str(error)}")
+    
+    def _show_error_popup(self, message):
+        """Show an error popup, reusing the same popup for every error."""
+        if not self._error_popup:
+            self._error_popup = Popup(
                 title='Error',
-                content=Label(text=f"Could not generate PDF: {str(e)}"),
+                content=Label(),
                 size_hint=(None, None),
                 size=(dp(400), dp(200))
             )
-            popup.open()
+        self._error_popup.content.text = message
+        self._error_popup.open()
     
     def _show_loading_popup(self, message="Loading..."):
         """Show a loading popup."""
@@ -465,72 +661,93 @@ class PDFPreviewView(Screen):
             if not destination.lower().endswith('.pdf'):
                 destination += '.pdf'
                 
-            # Copy the file
-            shutil.copy2(self.pdf_path, destination)
-            
-            # Show success message
-            self.show_save_success(destination)
+            # Copy the file on a worker thread; shutil uses the OS fast-copy path where available
+            future = _PDF_EXECUTOR.submit(shutil.copy2, self.pdf_path, destination)
+            future.add_done_callback(
+                lambda f: Clock.schedule_once(lambda dt: self._on_save_done(f, destination), 0)
+            )
             
         except Exception as e:
             print(f"Error saving PDF: {e}")
             self.show_save_error()
     
+    def _on_save_done(self, future, destination):
+        """Report the result of a PDF copy on the main thread."""
+        error = future.exception()
+        if error is None:
+            # Show success message
+            self.show_save_success(destination)
+        else:
+            print(f"Error saving PDF: {error}")
+            self.show_save_error()
+    
     def show_save_success(self, path):
         """Show a success popup after saving PDF."""
-        content = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
-        content.add_widget(Label(text=f"PDF successfully saved to:"))
-        content.add_widget(Label(text=f"{os.path.basename(path)}", bold=True))
+        self._saved_path = path
         
-        # Add an open file button if plyer can do it
-        try:
-            from plyer import utils
-            if hasattr(utils, 'open_file'):
-                open_button = get_icon_button(
-                    'open-in-app',
-                    callback=lambda x: utils.open_file(path),
-                    text="Open PDF",
-                    tooltip="Open the PDF file"
-                )
-                content.add_widget(open_button)
-        except:
-            pass
-        
-        popup = Popup(title='PDF Saved', content=content,
-                     size_hint=(None, None), size=(dp(400), dp(200)))
-        
-        # Add close button
-        close_button = get_icon_button('close', callback=popup.dismiss, tooltip="Close")
-        content.add_widget(close_button)
-        
-        popup.open()
+        # Build the popup once and only update the file name afterwards
+        if not self._save_success_popup:
+            content = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
+            content.add_widget(Label(text=f"PDF successfully saved to:"))
+            self._saved_name_label = Label(bold=True)
+            content.add_widget(self._saved_name_label)
+            
+            # Add an open file button if plyer can do it
+            try:
+                from plyer import utils
+                if hasattr(utils, 'open_file'):
+                    open_button = get_icon_button(
+                        'open-in-app',
+                        callback=lambda x: utils.open_file(self._saved_path),
+                        text="Open PDF",
+                        tooltip="Open the PDF file"
+                    )
+                    content.add_widget(open_button)
+            except:
+                pass
+            
+            self._save_success_popup = Popup(title='PDF Saved', content=content,
+                                             size_hint=(None, None), size=(dp(400), dp(200)))
+            
+            # Add close button
+            close_button = get_icon_button('close', callback=self._save_success_popup.dismiss, tooltip="Close")
+            content.add_widget(close_button)
+        
+        self._saved_name_label.text = os.path.basename(path)
+        self._save_success_popup.open()
     
     def show_save_error(self):
         """Show an error popup if saving fails."""
-        content = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
-        content.add_widget(Label(text="Error saving PDF file."))
-        content.add_widget(Label(text="Please check permissions and try again."))
-        
-        popup = Popup(title='Error', content=content,
-                     size_hint=(None, None), size=(dp(400), dp(200)))
-        
-        # We need to create the popup first, then add the button that refers to it
-        close_button = Button(
-            text="Close",
-            size_hint_y=None,
-            height=dp(40)
-        )
-        close_button.bind(on_press=popup.dismiss)
-        content.add_widget(close_button)
+        # The error popup has fixed content, so build it only once
+        if not self._save_error_popup:
+            content = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
+            content.add_widget(Label(text="Error saving PDF file."))
+            content.add_widget(Label(text="Please check permissions and try again."))
+            
+            self._save_error_popup = Popup(title='Error', content=content,
+                                           size_hint=(None, None), size=(dp(400), dp(200)))
+            
+            # We need to create the popup first, then add the button that refers to it
+            close_button = Button(
+                text="Close",
+                size_hint_y=None,
+                height=dp(40)
+            )
+            close_button.bind(on_press=self._save_error_popup.dismiss)
+            content.add_widget(close_button)
         
-        popup.open()
+        self._save_error_popup.open()
     
     def setup_preview(self, view_type, date):
         """Setup the preview with the given view type and date."""
         self.view_type = view_type
         self.current_date = date
         
+        if not self._ui_ready:
+            return
+        
         # Update device info
-        app = App.get_running_app()
+        app = self.app
         if app.selected_tablet:
             self.device_label.text = f"Selected Tablet: {app.selected_tablet}"
             
@@ -549,62 +766,28 @@ class PDFPreviewView(Screen):
         # Generate preview
         self.generate_preview()
     
+    @_safe_handler
     def _safe_show_dropdown(self, button):
         """Safely show the dropdown menu."""
-        try:
-            self.view_type_dropdown.open(button)
-        except Exception as e:
-            print(f"Error showing dropdown: {e}")
+        self.view_type_dropdown.open(button)
     
+    @_safe_handler
     def _safe_view_type_select(self, view_type):
         """Safely handle view type selection."""
-        try:
-            self.view_type = view_type
-            self.update_view_type_button()
-            Clock.schedule_once(lambda dt: self.generate_preview(), 0.1)
-        except Exception as e:
-            print(f"Error selecting view type: {e}")
-            # Try again with a delay
-            Clock.schedule_once(lambda dt: self._retry_view_type_select(view_type), 0.5)
-    
-    def _retry_view_type_select(self, view_type):
-        """Retry view type selection after a delay."""
-        try:
-            self.view_type = view_type
-            self.update_view_type_button()
-            self.generate_preview()
-        except Exception as e:
-            print(f"Retry view type selection also failed: {e}")
-    
-    def _safe_month_toggle(self, instance, value):
-        """Safely handle month toggle."""
-        try:
-            self.include_months = (value == 'down')
-            instance.text = "Yes" if self.include_months else "No"
-            Clock.schedule_once(lambda dt: self.generate_preview(), 0.1)
-        except Exception as e:
-            print(f"Error toggling month view: {e}")
-    
-    def _safe_week_toggle(self, instance, value):
-        """Safely handle week toggle."""
-        try:
-            self.include_weeks = (value == 'down')
-            instance.text = "Yes" if self.include_weeks else "No"
-            Clock.schedule_once(lambda dt: self.generate_preview(), 0.1)
-        except Exception as e:
-            print(f"Error toggling week view: {e}")
+        self.view_type = view_type
+        self.update_view_type_button()
+        self._schedule_preview()
     
-    def _safe_day_toggle(self, instance, value):
-        """Safely handle day toggle."""
-        try:
-            self.include_days = (value == 'down')
-            instance.text = "Yes" if self.include_days else "No"
-            Clock.schedule_once(lambda dt: self.generate_preview(), 0.1)
-        except Exception as e:
-            print(f"Error toggling day view: {e}")
+    @_safe_handler
+    def _safe_component_toggle(self, instance, value):
+        """Safely handle a calendar component toggle."""
+        include = (value == 'down')
+        self._components[instance.component] = include
+        instance.text = "Yes" if include else "No"
+        self._schedule_preview()
     
     def update_layout(self, dt=None):
         """Update layout when the size changes."""
         # Make sure right panel fills available space
-        if hasattr(self, 'layout') and hasattr(self, 'right_panel'):
+        if self._ui_ready:
             self.right_panel.size_hint_x = 0.7
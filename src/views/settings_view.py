@@ -9,6 +9,9 @@ from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
 from kivy.uix.togglebutton import ToggleButton
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.metrics import dp
 from kivymd.app import MDApp
 from kivy.graphics import Color, Rectangle
@@ -20,6 +23,75 @@ from utils.icon_helper import get_icon_button
 from utils.setup_helper import safe_navigate
 from utils.theme_manager import ThemeManager
 
+# Density-independent sizes used on this screen, converted once since the DPI is fixed per session
+(_DP10, _DP12, _DP20, _DP24, _DP30, _DP40, _DP50,
+ _DP120, _DP150, _DP200, _DP300, _DP400) = map(dp, (10, 12, 20, 24, 30, 40, 50, 120, 150, 200, 300, 400))
+
+# Height reserved for a settings section until it has been built
+_SECTION_PLACEHOLDER_HEIGHT = _DP200
+
+# Device models offered in the device type selector
+_DEVICE_TYPES = ("reMarkable 1", "reMarkable 2", "Paper Pro")
+
+# Rows shown in the calendar list before it scrolls
+_MAX_VISIBLE_CALENDARS = 6
+
+def _bind_rect(widget, rect):
+    """Keep a canvas rectangle covering the widget it was drawn on."""
+    def update(instance, value):
+        rect.pos = instance.pos
+        rect.size = instance.size
+    widget.fbind('pos', update)
+    widget.fbind('size', update)
+
+class CalendarRow(RecycleDataViewBehavior, BoxLayout):
+    """A recycled calendar list row with a remove button."""
+    
+    def __init__(self, **kwargs):
+        super(CalendarRow, self).__init__(spacing=_DP10, **kwargs)
+        self.url = None
+        self.remove_callback = None
+        
+        self.label = Label(halign='left', color=ThemeManager.COLORS['text_primary'])
+        remove_btn = get_icon_button(
+            ThemeManager.get_icon('remove'),
+            callback=self._remove,
+            tooltip="Remove Calendar",
+            size_hint_x=None,
+            width=_DP40
+        )
+        self.add_widget(self.label)
+        self.add_widget(remove_btn)
+    
+    def refresh_view_attrs(self, rv, index, data):
+        """Point the row at a different calendar."""
+        self.url = data['url']
+        self.remove_callback = rv.remove_callback
+        self.label.text = data['text']
+    
+    def _remove(self, instance):
+        """Remove the calendar this row is showing."""
+        if self.remove_callback:
+            self.remove_callback(self.url, instance)
+
+class SectionHeader(BoxLayout):
+    """A settings section title on a tinted background."""
+    
+    def __init__(self, title, **kwargs):
+        super(SectionHeader, self).__init__(size_hint_y=None, height=_DP40, **kwargs)
+        
+        # Each header owns its background rectangle
+        with self.canvas.before:
+            Color(*ThemeManager.COLORS['primary'], 0.2)  # Light primary color background
+            _bind_rect(self, Rectangle(pos=self.pos, size=self.size))
+        
+        self.add_widget(Label(
+            text=title,
+            bold=True,
+            font_size=ThemeManager.FONT_SIZES['h3'],
+            color=ThemeManager.COLORS['text_primary']
+        ))
+
 class SettingsView(Screen):
     """Settings view screen."""
     
@@ -28,35 +100,43 @@ class SettingsView(Screen):
         # Initialize the settings_inputs dictionary first
         self.settings_inputs = {}
         self.config_manager = ConfigManager()
+        self._config_snapshot = None
+        
+        # Confirmation popup, created on the first save and closed automatically
+        self._saved_popup = None
+        self._dismiss_saved_popup = Clock.create_trigger(self._close_saved_popup, 2)
+        self._error_popup = None
+        
+        colors = ThemeManager.COLORS
+        get_icon = ThemeManager.get_icon
         
         # Set background color for the screen
         with self.canvas.before:
-            Color(*ThemeManager.COLORS['background'])
-            self.bg_rect = Rectangle(pos=self.pos, size=self.size)
-            self.bind(pos=self._update_bg_rect, size=self._update_bg_rect)
+            Color(*colors['background'])
+            _bind_rect(self, Rectangle(pos=self.pos, size=self.size))
         
         # Create the main layout
-        main_layout = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
+        main_layout = BoxLayout(orientation='vertical', padding=_DP20, spacing=_DP10)
         
         # Top bar with back button
-        top_bar = BoxLayout(size_hint_y=None, height=dp(50), spacing=dp(10))
+        top_bar = BoxLayout(size_hint_y=None, height=_DP50, spacing=_DP10)
         
         # Back button with icon
         back_button = get_icon_button(
-            ThemeManager.get_icon('back'),
+            get_icon('back'),
             callback=self.go_back,
             tooltip="Back to Dashboard",
             size_hint=(None, None),
-            size=(dp(40), dp(40))
+            size=(_DP40, _DP40)
         )
         
         # Title
         title_label = Label(
             text="Settings",
-            font_size=dp(24),
+            font_size=_DP24,
             bold=True,
             size_hint_x=1,
-            color=ThemeManager.COLORS['text_primary']
+            color=colors['text_primary']
         )
         
         top_bar.add_widget(back_button)
@@ -64,30 +144,35 @@ class SettingsView(Screen):
         
         # Create scrollable content for settings
         scroll_view = ScrollView()
-        settings_container = BoxLayout(orientation='vertical', spacing=dp(20), 
-                                      size_hint_y=None, padding=(0, 0, 0, dp(20)))
+        settings_container = BoxLayout(orientation='vertical', spacing=_DP20, 
+                                      size_hint_y=None, padding=(0, 0, 0, _DP20))
         settings_container.bind(minimum_height=settings_container.setter('height'))
         
         # Set a background color for the settings container
         with settings_container.canvas.before:
-            Color(*ThemeManager.COLORS['surface'])
-            self.container_rect = Rectangle(pos=settings_container.pos, size=settings_container.size)
-            settings_container.bind(pos=self._update_container_rect, size=self._update_container_rect)
-        
-        # Add the settings sections
-        self._create_weather_settings(settings_container)
-        self._create_calendar_settings(settings_container)
-        self._create_display_settings(settings_container)
-        self._create_device_settings(settings_container)
+            Color(*colors['surface'])
+            _bind_rect(settings_container, Rectangle(pos=settings_container.pos, size=settings_container.size))
+        
+        # Reserve a slot for each settings section; each is filled once it scrolls into view
+        self._section_slots = []
+        for builder in (self._create_weather_settings, self._create_calendar_settings,
+                        self._create_display_settings, self._create_device_settings):
+            slot = BoxLayout(orientation='vertical', size_hint_y=None,
+                             height=_SECTION_PLACEHOLDER_HEIGHT)
+            settings_container.add_widget(slot)
+            self._section_slots.append((builder, slot))
+        self._built_sections = set()
+        self._entered = False
+        self._scroll_view = scroll_view
         
         # Add a Save Settings button at the bottom
         save_button = get_icon_button(
-            ThemeManager.get_icon('save'),
+            get_icon('save'),
             callback=self.save_settings,
             tooltip="Save Settings",
             text="Save Settings",
             size_hint=(None, None),
-            size=(dp(200), dp(50)),
+            size=(_DP200, _DP50),
             pos_hint={'center_x': 0.5}
         )
         
@@ -98,75 +183,129 @@ class SettingsView(Screen):
         main_layout.add_widget(save_button)
         self.add_widget(main_layout)
     
-    def _update_bg_rect(self, instance, value):
-        """Update the background rectangle position and size."""
-        if hasattr(self, 'bg_rect'):
-            self.bg_rect.pos = instance.pos
-            self.bg_rect.size = instance.size
+    def on_pre_enter(self, *args):
+        """Build the visible settings sections the first time the screen is shown."""
+        if self._entered:
+            self._refresh_inputs()
+            return
+        self._entered = True
+        
+        # Wait a frame so the slots have been laid out before checking what is visible
+        Clock.schedule_once(self._build_visible_sections, 0)
+        self._scroll_view.bind(scroll_y=self._build_visible_sections)
+        
+        # Once the first sections are painted, build the rest too; scrolling alone can't be relied
+        # on since a resized window may fit them all without scroll_y ever changing
+        Clock.schedule_once(self._build_remaining_sections, 0.5)
     
-    def _update_container_rect(self, instance, value):
-        """Update the container rectangle position and size."""
-        if hasattr(self, 'container_rect'):
-            self.container_rect.pos = instance.pos
-            self.container_rect.size = instance.size
+    def _build_visible_sections(self, *args):
+        """Build the sections whose slots are in view and have not been built yet."""
+        self._schedule_sections(self._is_in_viewport)
     
-    def go_back(self, instance):
-        """Return to the main screen."""
-        app = MDApp.get_running_app()
-        safe_navigate('pdf_preview' if app.has_completed_setup else 'tablet_selection', transition_direction='right')
+    def _build_remaining_sections(self, dt):
+        """Build every section that has not been built yet, visible or not."""
+        self._schedule_sections(lambda slot: True)
     
-    def _create_section_header(self, title):
-        """Create a section header with a title."""
-        header_layout = BoxLayout(size_hint_y=None, height=dp(40))
-        
-        with header_layout.canvas.before:
-            Color(*ThemeManager.COLORS['primary'], 0.2)  # Light primary color background
-            self.rect = Rectangle(pos=header_layout.pos, size=header_layout.size)
+    def _schedule_sections(self, should_build):
+        """Schedule building the unbuilt sections whose slots pass the given check."""
+        pending = 0
+        for builder, slot in self._section_slots:
+            if slot in self._built_sections or not should_build(slot):
+                continue
+            self._built_sections.add(slot)
             
-        header_layout.bind(pos=self._update_rect, size=self._update_rect)
+            # One section per frame so no single frame has to build the whole form
+            Clock.schedule_once(partial(self._build_section, builder, slot), pending * 0.05)
+            pending += 1
         
-        label = Label(
-            text=title,
-            bold=True,
-            font_size=ThemeManager.FONT_SIZES['h3'],
-            color=ThemeManager.COLORS['text_primary']
-        )
-        header_layout.add_widget(label)
+        if len(self._built_sections) == len(self._section_slots):
+            self._scroll_view.unbind(scroll_y=self._build_visible_sections)
+    
+    def _is_in_viewport(self, widget):
+        """Check whether a widget overlaps the visible part of the scroll view."""
+        scroll_view = self._scroll_view
+        _, widget_y = widget.to_window(*widget.pos)
+        _, view_y = scroll_view.to_window(*scroll_view.pos)
+        return widget_y < view_y + scroll_view.height and widget_y + widget.height > view_y
+    
+    def _refresh_inputs(self):
+        """Show the saved settings in the existing widgets instead of rebuilding them."""
+        # Other screens save through their own ConfigManager, so check the file again
+        config = self._config_snapshot = self.config_manager.get_snapshot()
+        inputs = self.settings_inputs
+        
+        if 'weather_api_key' in inputs:
+            inputs['weather_api_key'].text = config["weather"].get("api_key") or ""
+            inputs['weather_location'].text = config["weather"].get("location") or ""
+        
+        if 'device_name' in inputs:
+            inputs['device_name'].text = config["device"].get("name") or "My reMarkable"
+            device_type = config["device"].get("type") or "reMarkable 2"
+            for type_name, button in inputs['device_type_buttons'].items():
+                button.state = 'down' if type_name == device_type else 'normal'
+        
+        if 'time_format_buttons' in inputs:
+            use_24h = config["display"]["use_24h_time"]
+            monday_first = config["display"]["monday_first"]
+            inputs['time_format_buttons']["24h"].state = 'down' if use_24h else 'normal'
+            inputs['time_format_buttons']["12h"].state = 'normal' if use_24h else 'down'
+            inputs['week_start_buttons']["monday"].state = 'down' if monday_first else 'normal'
+            inputs['week_start_buttons']["sunday"].state = 'normal' if monday_first else 'down'
         
-        return header_layout
+        self.update_calendar_list()
+    
+    def _build_section(self, builder, slot, dt):
+        """Build one settings section off-tree, then attach it to its reserved slot."""
+        try:
+            section = BoxLayout(orientation='vertical', spacing=_DP20, size_hint_y=None)
+            section.bind(minimum_height=section.setter('height'))
+            builder(section)
+            slot.add_widget(section)
+            slot.bind(minimum_height=slot.setter('height'))
+        except Exception as e:
+            print(f"Error building settings section: {e}")
     
-    def _update_rect(self, instance, value):
-        """Update the rectangle position and size."""
-        if hasattr(self, 'rect'):
-            self.rect.pos = instance.pos
-            self.rect.size = instance.size
+    def _get_snapshot(self):
+        """Get the settings the sections are filled from, reading them only once."""
+        if self._config_snapshot is None:
+            self._config_snapshot = self.config_manager.get_snapshot()
+        return self._config_snapshot
+    
+    def go_back(self, instance):
+        """Return to the main screen."""
+        app = MDApp.get_running_app()
+        safe_navigate('pdf_preview' if app.has_completed_setup else 'tablet_selection', transition_direction='right')
     
     def _create_weather_settings(self, parent):
         """Create the weather API settings section."""
+        text_primary = ThemeManager.COLORS['text_primary']
+        
         # Section header
-        parent.add_widget(self._create_section_header("Weather Settings"))
+        parent.add_widget(SectionHeader("Weather Settings"))
+        
+        weather = self._get_snapshot().get("weather", {})
         
         # Settings grid
-        weather_grid = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(120))
+        weather_grid = GridLayout(cols=2, spacing=_DP10, size_hint_y=None, height=_DP120)
         
         # API Key
-        weather_grid.add_widget(Label(text="OpenWeatherMap API Key:", halign='right', color=ThemeManager.COLORS['text_primary']))
+        weather_grid.add_widget(Label(text="OpenWeatherMap API Key:", halign='right', color=text_primary))
         weather_api_key = TextInput(
             multiline=False,
             hint_text="Enter your API key",
             write_tab=False,
-            text=self.config_manager.get_setting("weather", "api_key") or ""
+            text=weather.get("api_key") or ""
         )
         self.settings_inputs['weather_api_key'] = weather_api_key
         weather_grid.add_widget(weather_api_key)
         
         # Location
-        weather_grid.add_widget(Label(text="Location (city name):", halign='right', color=ThemeManager.COLORS['text_primary']))
+        weather_grid.add_widget(Label(text="Location (city name):", halign='right', color=text_primary))
         weather_location = TextInput(
             multiline=False,
             hint_text="e.g., London,UK",
             write_tab=False,
-            text=self.config_manager.get_setting("weather", "location") or ""
+            text=weather.get("location") or ""
         )
         self.settings_inputs['weather_location'] = weather_location
         weather_grid.add_widget(weather_location)
@@ -177,9 +316,9 @@ class SettingsView(Screen):
         info_text = Label(
             text="Get your free API key at https://openweathermap.org/api",
             italic=True,
-            font_size=dp(12),
+            font_size=_DP12,
             size_hint_y=None,
-            height=dp(30),
+            height=_DP30,
             color=ThemeManager.COLORS['text_secondary']
         )
         parent.add_widget(info_text)
@@ -187,10 +326,10 @@ class SettingsView(Screen):
     def _create_calendar_settings(self, parent):
         """Create the calendar settings section."""
         # Section header
-        parent.add_widget(self._create_section_header("Calendar Settings"))
+        parent.add_widget(SectionHeader("Calendar Settings"))
         
         # URL input layout
-        url_layout = BoxLayout(size_hint_y=None, height=dp(50), spacing=dp(10))
+        url_layout = BoxLayout(size_hint_y=None, height=_DP50, spacing=_DP10)
         url_input = TextInput(
             hint_text="Enter iCal URL",
             multiline=False,
@@ -211,7 +350,7 @@ class SettingsView(Screen):
             callback=self.add_calendar,
             tooltip="Add Calendar",
             size_hint_x=None,
-            width=dp(50)
+            width=_DP50
         )
         
         url_layout.add_widget(url_input)
@@ -219,10 +358,33 @@ class SettingsView(Screen):
         url_layout.add_widget(add_button)
         parent.add_widget(url_layout)
         
-        # Calendar list layout
+        # Calendar list layout; only the visible rows are instantiated
         calendar_list_layout = BoxLayout(orientation='vertical', size_hint_y=None)
         calendar_list_layout.bind(minimum_height=calendar_list_layout.setter('height'))
-        self.settings_inputs['calendar_list'] = calendar_list_layout
+        
+        empty_label = Label(
+            text="No calendars added yet",
+            italic=True,
+            size_hint_y=None,
+            height=_DP40,
+            color=ThemeManager.COLORS['text_secondary']
+        )
+        calendar_list_layout.add_widget(empty_label)
+        
+        calendar_rv = RecycleView(viewclass=CalendarRow, size_hint_y=None, height=0)
+        # One handler shared by every row; rows pass in their own URL
+        calendar_rv.remove_callback = self.remove_calendar
+        calendar_rv.add_widget(RecycleBoxLayout(
+            default_size=(None, _DP40),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            orientation='vertical'
+        ))
+        calendar_rv.layout_manager.bind(minimum_height=calendar_rv.layout_manager.setter('height'))
+        calendar_list_layout.add_widget(calendar_rv)
+        
+        self.settings_inputs['calendar_list'] = calendar_rv
+        self.settings_inputs['calendar_empty_label'] = empty_label
         
         # Populate the calendar list
         self.update_calendar_list()
@@ -232,75 +394,78 @@ class SettingsView(Screen):
     
     def _create_device_settings(self, parent):
         """Create the device settings section."""
+        text_primary = ThemeManager.COLORS['text_primary']
+        
         # Section header
-        parent.add_widget(self._create_section_header("Device Settings"))
+        parent.add_widget(SectionHeader("Device Settings"))
+        
+        device = self._get_snapshot().get("device", {})
         
         # Device settings grid
-        device_grid = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(120))
+        device_grid = GridLayout(cols=2, spacing=_DP10, size_hint_y=None, height=_DP120)
         
         # Device name
-        device_grid.add_widget(Label(text="Device Name:", halign='right', color=ThemeManager.COLORS['text_primary']))
+        device_grid.add_widget(Label(text="Device Name:", halign='right', color=text_primary))
         device_name = TextInput(
             multiline=False,
             hint_text="My reMarkable",
             write_tab=False,
-            text=self.config_manager.get_setting("device", "name") or "My reMarkable"
+            text=device.get("name") or "My reMarkable"
         )
         self.settings_inputs['device_name'] = device_name
         device_grid.add_widget(device_name)
         
         # Device type selection
-        device_grid.add_widget(Label(text="Device Type:", halign='right', color=ThemeManager.COLORS['text_primary']))
-        device_type_layout = BoxLayout(spacing=dp(10))
+        device_grid.add_widget(Label(text="Device Type:", halign='right', color=text_primary))
+        device_type_layout = BoxLayout(spacing=_DP10)
         
         # Get current device type
-        current_device_type = self.config_manager.get_setting("device", "type") or "reMarkable 2"
-        
-        # Create toggle buttons for device types
-        rm1_button = ToggleButton(
-            text="reMarkable 1",
-            group="device_type",
-            state='down' if current_device_type == "reMarkable 1" else 'normal'
-        )
-        rm2_button = ToggleButton(
-            text="reMarkable 2",
-            group="device_type",
-            state='down' if current_device_type == "reMarkable 2" else 'normal'
-        )
-        rmpro_button = ToggleButton(
-            text="Paper Pro",
-            group="device_type",
-            state='down' if current_device_type == "Paper Pro" else 'normal'
-        )
-        
-        self.settings_inputs['device_type_buttons'] = {
-            "reMarkable 1": rm1_button,
-            "reMarkable 2": rm2_button,
-            "Paper Pro": rmpro_button
-        }
+        current_device_type = device.get("type") or "reMarkable 2"
+        
+        # Create toggle buttons for device types, tracking the pressed one so
+        # saving doesn't have to search for it
+        self._selected_device_type = current_device_type
+        self.settings_inputs['device_type_buttons'] = {}
+        for type_name in _DEVICE_TYPES:
+            button = ToggleButton(
+                text=type_name,
+                group="device_type",
+                state='down' if current_device_type == type_name else 'normal'
+            )
+            button.device_type = type_name
+            button.bind(state=self._on_device_type_state)
+            self.settings_inputs['device_type_buttons'][type_name] = button
+            device_type_layout.add_widget(button)
         
-        device_type_layout.add_widget(rm1_button)
-        device_type_layout.add_widget(rm2_button)
-        device_type_layout.add_widget(rmpro_button)
         device_grid.add_widget(device_type_layout)
         
         parent.add_widget(device_grid)
     
+    def _on_device_type_state(self, button, state):
+        """Remember which device type toggle is down."""
+        if state == 'down':
+            self._selected_device_type = button.device_type
+        elif self._selected_device_type == button.device_type:
+            self._selected_device_type = "reMarkable 2"  # default
+    
     def _create_display_settings(self, parent):
         """Create the display settings section."""
+        text_primary = ThemeManager.COLORS['text_primary']
+        
         # Section header
-        parent.add_widget(self._create_section_header("Display Settings"))
+        parent.add_widget(SectionHeader("Display Settings"))
+        
+        display = self._get_snapshot().get("display", {})
         
         # Display settings grid
-        display_grid = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(120))
+        display_grid = GridLayout(cols=2, spacing=_DP10, size_hint_y=None, height=_DP120)
         
         # Time format setting (24-hour vs 12-hour)
-        display_grid.add_widget(Label(text="Time Format:", halign='right', color=ThemeManager.COLORS['text_primary']))
-        time_format_layout = BoxLayout(spacing=dp(10))
+        display_grid.add_widget(Label(text="Time Format:", halign='right', color=text_primary))
+        time_format_layout = BoxLayout(spacing=_DP10)
         
         # Get current time format setting
-        use_24h = self.config_manager.get_setting("display", "use_24h_time")
-        use_24h = True if use_24h == "True" else False
+        use_24h = display["use_24h_time"]
         
         # Create toggle buttons for time format
         h12_button = ToggleButton(
@@ -324,12 +489,11 @@ class SettingsView(Screen):
         display_grid.add_widget(time_format_layout)
         
         # Week start setting (Monday vs Sunday)
-        display_grid.add_widget(Label(text="Week Starts On:", halign='right', color=ThemeManager.COLORS['text_primary']))
-        week_start_layout = BoxLayout(spacing=dp(10))
+        display_grid.add_widget(Label(text="Week Starts On:", halign='right', color=text_primary))
+        week_start_layout = BoxLayout(spacing=_DP10)
         
         # Get current week start setting
-        monday_first = self.config_manager.get_setting("display", "monday_first")
-        monday_first = True if monday_first == "True" else False
+        monday_first = display["monday_first"]
         
         # Create toggle buttons for week start
         sunday_button = ToggleButton(
@@ -359,45 +523,27 @@ class SettingsView(Screen):
         calendar_list = self.settings_inputs.get('calendar_list')
         if not calendar_list:
             return
-            
-        # Clear existing calendar entries
-        calendar_list.clear_widgets()
         
         # Get calendars from config
         calendars = self.config_manager.get_calendars()
         
-        if not calendars:
-            calendar_list.add_widget(Label(
-                text="No calendars added yet",
-                italic=True,
-                size_hint_y=None,
-                height=dp(40),
-                color=ThemeManager.COLORS['text_secondary']
-            ))
+        # Rows are recycled, so only the data changes; unchanged data would still refresh every row
+        data = [
+            {'text': f"{calendar['name']}: {calendar['url']}", 'url': calendar['url']}
+            for calendar in calendars
+        ]
+        if data == calendar_list.data:
             return
-            
-        # Create an entry for each calendar
-        for i, calendar in enumerate(calendars):
-            cal_entry = BoxLayout(size_hint_y=None, height=dp(40), spacing=dp(10))
-            
-            # Calendar name/URL display
-            cal_text = f"{calendar['name']}: {calendar['url']}"
-            cal_label = Label(text=cal_text, halign='left', text_size=(None, None), color=ThemeManager.COLORS['text_primary'])
-            
-            # Remove button with icon
-            remove_btn = get_icon_button(
-                ThemeManager.get_icon('remove'),
-                callback=partial(self.remove_calendar, calendar['url']),
-                tooltip="Remove Calendar",
-                size_hint_x=None,
-                width=dp(40)
-            )
-            
-            cal_entry.add_widget(cal_label)
-            cal_entry.add_widget(remove_btn)
-            calendar_list.add_widget(cal_entry)
-            
-        calendar_list.height = len(calendars) * dp(40)
+        
+        # Size the list before filling it so the rows are laid out once, at their final viewport
+        calendar_list.height = min(len(calendars), _MAX_VISIBLE_CALENDARS) * _DP40
+        
+        # Show the placeholder text only when there is nothing to list
+        empty_label = self.settings_inputs['calendar_empty_label']
+        empty_label.height = 0 if calendars else _DP40
+        empty_label.opacity = 0 if calendars else 1
+        
+        calendar_list.data = data
     
     def add_calendar(self, instance):
         """Add a new calendar to the configuration."""
@@ -427,119 +573,85 @@ class SettingsView(Screen):
     
     def save_settings(self, instance):
         """Save all settings from the UI to the configuration."""
-        try:
-            # Show a loading indicator
-            self._show_loading_popup("Saving settings...")
-            
-            # Schedule the actual save with a short delay
-            Clock.schedule_once(lambda dt: self._perform_save_settings(), 0.1)
-        except Exception as e:
-            print(f"Error initiating settings save: {e}")
-            self._show_error_popup(f"Could not save settings: {str(e)}")
+        # Saving is a few small JSON writes, quick enough to do right away
+        self._perform_save_settings()
     
     def _perform_save_settings(self):
         """Perform the actual settings save."""
         try:
-            # Save weather settings
-            weather_api_key = self.settings_inputs.get('weather_api_key')
-            weather_location = self.settings_inputs.get('weather_location')
-            
-            if weather_api_key and weather_location:
-                self.config_manager.set_weather_settings(
-                    weather_api_key.text.strip(),
-                    weather_location.text.strip()
-                )
-            
-            # Save device settings
-            device_name = self.settings_inputs.get('device_name')
-            device_type_buttons = self.settings_inputs.get('device_type_buttons', {})
+            # The saved values replace whatever was read before
+            self._config_snapshot = None
             
-            if device_name:
-                # Find the selected device type
-                device_type = "reMarkable 2"  # default
-                for type_name, button in device_type_buttons.items():
-                    if button.state == 'down':
-                        device_type = type_name
-                        break
-                
-                self.config_manager.set_device_settings(
-                    device_name.text.strip(),
-                    device_type
-                )
-            
-            # Save display settings
-            time_format_buttons = self.settings_inputs.get('time_format_buttons', {})
-            week_start_buttons = self.settings_inputs.get('week_start_buttons', {})
+            # Each setter rewrites the config file, so only call it when something changed
+            config = self.config_manager.get_snapshot()
             
-            use_24h = False
-            for format_name, button in time_format_buttons.items():
-                if button.state == 'down' and format_name == "24h":
-                    use_24h = True
-                    break
+            # Sections register all of their inputs together, and unbuilt sections have nothing to save
+            inputs = self.settings_inputs
+            changed = False
             
-            monday_first = False
-            for start_name, button in week_start_buttons.items():
-                if button.state == 'down' and start_name == "monday":
-                    monday_first = True
-                    break
-            
-            self.config_manager.set_display_settings(
-                use_24h,
-                monday_first
-            )
+            # Save weather settings
+            if 'weather_api_key' in inputs:
+                weather = (inputs['weather_api_key'].text.strip(), inputs['weather_location'].text.strip())
+                saved = config["weather"]
+                if weather != (saved.get("api_key"), saved.get("location")):
+                    self.config_manager.set_weather_settings(*weather)
+                    changed = True
             
-            # Update the UI to reflect any changes
-            self.update_calendar_list()
+            # Save device settings
+            if 'device_name' in inputs:
+                device = (inputs['device_name'].text.strip(), self._selected_device_type)
+                saved = config["device"]
+                if device != (saved.get("name"), saved.get("type")):
+                    self.config_manager.set_device_settings(*device)
+                    changed = True
             
-            # Dismiss loading popup if it exists
-            if hasattr(self, '_loading_popup') and self._loading_popup:
-                self._loading_popup.dismiss()
-                self._loading_popup = None
+            # Save display settings
+            if 'time_format_buttons' in inputs:
+                use_24h = inputs['time_format_buttons']["24h"].state == 'down'
+                monday_first = inputs['week_start_buttons']["monday"].state == 'down'
+                
+                saved = config["display"]
+                if (use_24h, monday_first) != (saved.get("use_24h_time"), saved.get("monday_first")):
+                    self.config_manager.set_display_settings(
+                        use_24h,
+                        monday_first
+                    )
+                    changed = True
             
-            # Notify the app that settings have changed
+            # Notify the app that settings have changed; it re-renders the preview, so skip no-op saves
             app = MDApp.get_running_app()
-            if hasattr(app, 'on_settings_changed'):
+            if changed and hasattr(app, 'on_settings_changed'):
                 app.on_settings_changed()
             
             # Show a popup confirmation
-            popup = Popup(
-                title='Settings Saved',
-                content=Label(text='Your settings have been saved.', color=ThemeManager.COLORS['text_primary']),
-                size_hint=(None, None),
-                size=(dp(300), dp(150))
-            )
-            popup.open()
+            if not self._saved_popup:
+                self._saved_popup = Popup(
+                    title='Settings Saved',
+                    content=Label(text='Your settings have been saved.', color=ThemeManager.COLORS['text_primary']),
+                    size_hint=(None, None),
+                    size=(_DP300, _DP150)
+                )
+            self._saved_popup.open()
             
-            # Auto-close after 2 seconds
-            Clock.schedule_once(lambda dt: popup.dismiss(), 2)
+            # Auto-close after 2 seconds, counting from the latest save
+            self._dismiss_saved_popup.cancel()
+            self._dismiss_saved_popup()
         except Exception as e:
             print(f"Error saving settings: {e}")
-            if hasattr(self, '_loading_popup') and self._loading_popup:
-                self._loading_popup.dismiss()
-                self._loading_popup = None
             self._show_error_popup(f"Could not save settings: {str(e)}")
     
-    def _show_loading_popup(self, message="Loading..."):
-        """Show a loading popup."""
-        content = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
-        content.add_widget(Label(text=message, color=ThemeManager.COLORS['text_primary']))
-        
-        # Create and store the popup
-        self._loading_popup = Popup(
-            title='Please Wait',
-            content=content,
-            size_hint=(None, None),
-            size=(dp(300), dp(150)),
-            auto_dismiss=False
-        )
-        self._loading_popup.open()
+    def _close_saved_popup(self, dt):
+        """Close the settings saved confirmation."""
+        self._saved_popup.dismiss()
     
     def _show_error_popup(self, message):
-        """Show an error popup."""
-        popup = Popup(
-            title='Error',
-            content=Label(text=message, color=ThemeManager.COLORS['text_primary']),
-            size_hint=(None, None),
-            size=(dp(400), dp(200))
-        )
-        popup.open()
+        """Show an error popup, reusing the same popup for every error."""
+        if not self._error_popup:
+            self._error_popup = Popup(
+                title='Error',
+                content=Label(color=ThemeManager.COLORS['text_primary']),
+                size_hint=(None, None),
+                size=(_DP400, _DP200)
+            )
+        self._error_popup.content.text = message
+        self._error_popup.open()
@@ -1,170 +1,329 @@
 """
 Tablet selection screen for the reMarkable Agenda Generator.
 """
+import hashlib
 import os
+import tempfile
+from functools import partial
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.button import Button
+from kivy.uix.widget import Widget
+from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.label import Label
-from kivy.uix.image import Image
+from kivy.cache import Cache
+from kivy.core.image import Image as CoreImage
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics import Color, Rectangle
 from kivy.metrics import dp
 from kivy.app import App
-from kivy.clock import Clock
 from kivy.uix.popup import Popup
+from PIL import Image as PILImage
 
 from utils.ui_helpers import SafeLabel
 from utils.theme_manager import ThemeManager
 
-class DeviceButton(BoxLayout):
-    """Custom button with image for device selection."""
+# Density-independent sizes used on this screen, converted once since the DPI is fixed per session
+(_DP14, _DP16, _DP20, _DP24, _DP30, _DP40,
+ _DP50, _DP200, _DP250, _DP300, _DP400) = map(dp, (14, 16, 20, 24, 30, 40, 50, 200, 250, 300, 400))
+
+# Selectable tablet models and their product images
+_DEVICES = (
+    ("reMarkable 1", "remarkable1.jpg"),
+    ("reMarkable 2", "remarkable2.jpg"),
+    ("Paper Pro", "paperpro.jpg")
+)
+
+# Where the device images live, and the image used when one is missing
+_IMAGE_DIR = os.path.join("assets", "images")
+_PLACEHOLDER_IMAGE = os.path.join(_IMAGE_DIR, "device_placeholder.png")
+
+# Device images fill the top 80% of a device button, so originals are downscaled to that once
+_IMAGE_HEIGHT = int(_DP250 * 0.8)
+_THUMBNAIL_SIZE = (_IMAGE_HEIGHT, _IMAGE_HEIGHT)
+_THUMBNAIL_DIR = os.path.join(tempfile.gettempdir(), "rmagenda_thumbs")
+
+def _remove_stale_files(prefix, keep_path):
+    """Delete cached PNGs with the given name prefix, except the one just written."""
+    try:
+        with os.scandir(_THUMBNAIL_DIR) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith(".png") and entry.path != keep_path:
+                    os.unlink(entry.path)
+    except OSError:
+        pass
+
+def _get_thumbnail(image_path):
+    """
+    Get a downscaled copy of an image, generating it on first use.
+    
+    Returns:
+        str: Path to the cached thumbnail, or the original path if it could not be made
+    """
+    try:
+        # Key on the modification time and size too so edited images or sizes get a fresh thumbnail
+        # Prefixed per source image so older thumbnails of it can be found and removed
+        source_path = os.path.abspath(image_path)
+        prefix = "thumb_" + hashlib.md5(source_path.encode()).hexdigest()[:8] + "_"
+        key = f"{source_path}:{os.path.getmtime(image_path)}:{_THUMBNAIL_SIZE}"
+        thumbnail_path = os.path.join(_THUMBNAIL_DIR, prefix + hashlib.md5(key.encode()).hexdigest() + ".png")
+        
+        if not os.path.exists(thumbnail_path):
+            os.makedirs(_THUMBNAIL_DIR, exist_ok=True)
+            with PILImage.open(image_path) as image:
+                image.thumbnail(_THUMBNAIL_SIZE, PILImage.LANCZOS)
+                image.save(thumbnail_path, format='png')
+            _remove_stale_files(prefix, thumbnail_path)
+        return thumbnail_path
+    except Exception as e:
+        print(f"Error creating thumbnail for {image_path}: {e}")
+        return image_path
+
+def _resolve_image(image_name):
+    """Get the path of a device image, falling back to the placeholder, or None if both are missing."""
+    image_path = os.path.join(_IMAGE_DIR, image_name)
+    if os.path.exists(image_path):
+        return _get_thumbnail(image_path)
+    if os.path.exists(_PLACEHOLDER_IMAGE):
+        return _PLACEHOLDER_IMAGE
+    return None
+
+def _build_image_sheet(image_paths):
+    """
+    Pack images side by side into one cached PNG so they can share a single texture.
+    
+    Returns:
+        tuple: (sheet_path, regions) where regions maps each image path to its
+            (x, y, width, height) in the sheet, measured from the bottom left as
+            Kivy textures are; (None, {}) if the sheet could not be made
+    """
+    try:
+        image_paths = sorted(set(image_paths))
+        key = ":".join(f"{os.path.abspath(path)}:{os.path.getmtime(path)}" for path in image_paths)
+        sheet_path = os.path.join(_THUMBNAIL_DIR, "sheet_" + hashlib.md5(key.encode()).hexdigest() + ".png")
+        
+        # Opening only reads the headers, which is all the layout needs
+        images = [PILImage.open(path) for path in image_paths]
+        try:
+            sheet_height = max(image.height for image in images)
+            regions = {}
+            x = 0
+            for path, image in zip(image_paths, images):
+                regions[path] = (x, sheet_height - image.height, image.width, image.height)
+                x += image.width
+            
+            if not os.path.exists(sheet_path):
+                os.makedirs(_THUMBNAIL_DIR, exist_ok=True)
+                sheet = PILImage.new('RGBA', (x, sheet_height))
+                for path, image in zip(image_paths, images):
+                    sheet.paste(image.convert('RGBA'), (regions[path][0], 0))
+                sheet.save(sheet_path, format='png')
+                _remove_stale_files("sheet_", sheet_path)
+        finally:
+            for image in images:
+                image.close()
+        return sheet_path, regions
+    except Exception as e:
+        print(f"Error creating device image sheet: {e}")
+        return None, {}
+
+# Device image paths, sheet path and sheet regions, made on the first screen build
+_DEVICE_ASSETS = None
+
+def _device_assets():
+    """
+    Get the device images, checking and thumbnailing them once per session.
+    
+    All device images share one texture, so drawing the buttons binds a single texture.
+    
+    Returns:
+        tuple: (images, sheet_path, regions) where images maps each model to its image path
+    """
+    global _DEVICE_ASSETS
+    if _DEVICE_ASSETS is None:
+        images = {model: _resolve_image(image_name) for model, image_name in _DEVICES}
+        _DEVICE_ASSETS = (images, *_build_image_sheet(path for path in images.values() if path))
+    return _DEVICE_ASSETS
+
+# Label styles for this screen, built once and shared by every label of the same kind
+_TITLE_STYLE = {'font_size': _DP24, 'size_hint_y': None, 'height': _DP50, 'bold': True, 'halign': 'center'}
+_DESCRIPTION_STYLE = {'font_size': _DP16, 'size_hint_y': None, 'height': _DP30, 'halign': 'center'}
+_INFO_STYLE = {'font_size': _DP14, 'italic': True, 'size_hint_y': None, 'height': 2 * _DP30, 'halign': 'center'}
+
+# Decoded device images, shared by every button showing the same file; they never expire
+_IMAGE_CACHE = 'rm_device_images'
+Cache.register(_IMAGE_CACHE, limit=10)
+
+def _cached_image(image_path):
+    """Get the decoded image for a path, loading each file only once; None if it can't be loaded."""
+    image = Cache.get(_IMAGE_CACHE, image_path)
+    if image is None:
+        try:
+            image = CoreImage(image_path)
+        except Exception as e:
+            print(f"Error loading image {image_path}: {e}")
+            return None
+        Cache.append(_IMAGE_CACHE, image_path, image)
+    return image
+
+def _device_texture(image_path):
+    """Get the texture for a device image, cut from the shared sheet when there is one; None if missing."""
+    if not image_path:
+        return None
+    _, sheet_path, regions = _device_assets()
+    region = regions.get(image_path)
+    sheet = _cached_image(sheet_path) if region else None
+    if sheet is not None:
+        return sheet.texture.get_region(*region)
+    image = _cached_image(image_path)
+    return image.texture if image is not None else None
+
+# Rendered text textures, keyed by (text, font_size, bold, italic) since the strings never change
+_TEXT_TEX_CACHE = {}
+
+def _text_texture(text, font_size, bold=False, italic=False):
+    """Get the rendered texture for a piece of text, rasterizing each style only once."""
+    key = (text, font_size, bold, italic)
+    texture = _TEXT_TEX_CACHE.get(key)
+    if texture is None:
+        label = CoreLabel(text=text, font_size=font_size, bold=bold, italic=italic)
+        label.refresh()
+        texture = _TEXT_TEX_CACHE[key] = label.texture
+    return texture
+
+class DeviceButton(ButtonBehavior, Widget):
+    """Pressable device image with its model name on a band underneath, drawn as one widget."""
+    
+    # Theme colors shared by every device button
+    TEXT_COLOR = ThemeManager.COLORS['text_primary']
+    BUTTON_COLOR = ThemeManager.COLORS['primary']
+    PRESSED_COLOR = ThemeManager.COLORS['primary_light']
+    
+    # Share of the height used by the name band
+    BAND_RATIO = 0.2
     
     def __init__(self, text, image_source, callback, **kwargs):
-        super(DeviceButton, self).__init__(orientation='vertical', **kwargs)
-        self.size_hint = (1, None)
-        self.height = dp(250)
-        self.padding = ThemeManager.DIMENSIONS['padding']
-        self.spacing = ThemeManager.DIMENSIONS['spacing_medium']
-        
-        # Image
-        self.image = Image(
-            source=image_source, 
-            allow_stretch=True, 
-            keep_ratio=True, 
-            size_hint=(1, 0.8)
-        )
-        self.add_widget(self.image)
-        
-        # Button
-        self.button = Button(
-            text=text, 
-            size_hint=(1, 0.2), 
-            height=dp(40),
-            color=ThemeManager.COLORS['text_primary'],
-            background_color=ThemeManager.COLORS['primary']
-        )
-        self.button.bind(on_press=callback)
-        self.add_widget(self.button)
+        kwargs.setdefault('size_hint', (1, None))
+        kwargs.setdefault('height', _DP250)
+        super(DeviceButton, self).__init__(on_press=callback, **kwargs)
+        
+        self._image_texture = _device_texture(image_source)
+        text_texture = _text_texture(text, ThemeManager.FONT_SIZES['button'])
+        
+        with self.canvas:
+            # Without an image the button is just the name band
+            self._image_rect = None
+            if self._image_texture is not None:
+                Color(1, 1, 1, 1)
+                self._image_rect = Rectangle(texture=self._image_texture)
+            self._band_color = Color(*self.BUTTON_COLOR)
+            self._band_rect = Rectangle()
+            Color(*self.TEXT_COLOR)
+            self._text_rect = Rectangle(texture=text_texture, size=text_texture.size)
+        
+        self.fbind('pos', self._update_canvas)
+        self.fbind('size', self._update_canvas)
+        self.fbind('state', self._update_band_color)
+    
+    def _update_canvas(self, *args):
+        """Lay out the image, band and name within the widget."""
+        band_height = self.height * self.BAND_RATIO
+        self._band_rect.pos = self.pos
+        self._band_rect.size = (self.width, band_height)
+        
+        text_width, text_height = self._text_rect.size
+        self._text_rect.pos = (self.center_x - text_width / 2, self.y + (band_height - text_height) / 2)
         
-        # Schedule a delayed reload to ensure images load properly
-        Clock.schedule_once(self._reload_image, 0.5)
+        if self._image_rect is None:
+            return
+        
+        # Fit the image above the band, keeping its ratio; thumbnails are never scaled up
+        image_width, image_height = self._image_texture.size
+        area_height = self.height - band_height
+        scale = min(1, self.width / image_width, area_height / image_height)
+        width, height = image_width * scale, image_height * scale
+        self._image_rect.size = (width, height)
+        self._image_rect.pos = (self.center_x - width / 2, self.y + band_height + (area_height - height) / 2)
     
-    def _reload_image(self, dt):
-        """Reload the image after a delay to ensure it loads properly."""
-        if self.image:
-            self.image.reload()
+    def _update_band_color(self, instance, state):
+        """Highlight the band while the button is held down."""
+        self._band_color.rgba = self.PRESSED_COLOR if state == 'down' else self.BUTTON_COLOR
 
 class TabletSelectionView(Screen):
     """Tablet selection screen."""
     
     def __init__(self, **kwargs):
         super(TabletSelectionView, self).__init__(**kwargs)
-        
+        self._built = False
+    
+    def on_pre_enter(self, *args):
+        """Build the screen the first time it is shown."""
+        if not self._built:
+            self._build()
+            self._built = True
+    
+    def _build(self):
+        """Build the screen widgets."""
         # Main layout
-        self.layout = BoxLayout(orientation='vertical', padding=dp(30), spacing=dp(20))
+        self.layout = BoxLayout(orientation='vertical', padding=_DP30, spacing=_DP20)
         
         # Title
-        self.title = SafeLabel(
-            text="Select Your reMarkable Tablet Model",
-            font_size=dp(24),
-            size_hint_y=None,
-            height=dp(50),
-            bold=True,
-            halign='center'
-        )
+        self.title = SafeLabel(text="Select Your reMarkable Tablet Model", **_TITLE_STYLE)
         self.layout.add_widget(self.title)
         
         # Description
         self.description = SafeLabel(
             text="Choose your reMarkable tablet model to generate optimized PDFs",
-            font_size=dp(16),
-            size_hint_y=None,
-            height=dp(30),
-            halign='center'
+            **_DESCRIPTION_STYLE
         )
         self.layout.add_widget(self.description)
         
-        # Spacer
-        self.layout.add_widget(BoxLayout(size_hint_y=0.1))
+        # Spacer; a bare Widget since it only takes up free space
+        self.layout.add_widget(Widget(size_hint_y=0.1))
         
         # Device selection buttons with images
-        self.devices_layout = BoxLayout(orientation='horizontal', spacing=dp(30), size_hint_y=None, height=dp(300))
-        
-        # Get image paths
-        image_dir = os.path.join("assets", "images")
-        rm1_image = os.path.join(image_dir, "remarkable1.jpg")
-        rm2_image = os.path.join(image_dir, "remarkable2.jpg")
-        rmpro_image = os.path.join(image_dir, "paperpro.jpg")
-        
-        # Use default placeholder if images don't exist
-        default_image = os.path.join(image_dir, "device_placeholder.png")
-        rm1_image = rm1_image if os.path.exists(rm1_image) else default_image
-        rm2_image = rm2_image if os.path.exists(rm2_image) else default_image
-        rmpro_image = rmpro_image if os.path.exists(rmpro_image) else default_image
-        
-        # reMarkable 1 button with image
-        self.rm1 = DeviceButton(
-            text="reMarkable 1",
-            image_source=rm1_image,
-            callback=lambda x: self.select_tablet("reMarkable 1")
-        )
-        self.devices_layout.add_widget(self.rm1)
-        
-        # reMarkable 2 button with image
-        self.rm2 = DeviceButton(
-            text="reMarkable 2",
-            image_source=rm2_image,
-            callback=lambda x: self.select_tablet("reMarkable 2")
-        )
-        self.devices_layout.add_widget(self.rm2)
+        self.devices_layout = BoxLayout(orientation='horizontal', spacing=_DP30, size_hint_y=None, height=_DP300)
         
-        # reMarkable Paper Pro button with image
-        self.rm_pro = DeviceButton(
-            text="Paper Pro",
-            image_source=rmpro_image,
-            callback=lambda x: self.select_tablet("Paper Pro")
-        )
-        self.devices_layout.add_widget(self.rm_pro)
+        # One button with image per supported model
+        self.device_buttons = {}
+        device_images, _, _ = _device_assets()
+        for model, image_source in device_images.items():
+            button = DeviceButton(
+                text=model,
+                image_source=image_source,
+                callback=partial(self._on_select, model)
+            )
+            self.device_buttons[model] = button
+            self.devices_layout.add_widget(button)
         
         self.layout.add_widget(self.devices_layout)
         
         # Information
         self.info = SafeLabel(
-            text="Note: PDF templates are optimized for each specific device model",
-            font_size=dp(14),
-            italic=True,
-            size_hint_y=None,
-            height=dp(30),
-            halign='center'
+            text="Note: PDF templates are optimized for each specific device model\n"
+                 "Color support available for Paper Pro only",
+            **_INFO_STYLE
         )
         self.layout.add_widget(self.info)
         
-        # Color support info
-        self.color_info = SafeLabel(
-            text="Color support available for Paper Pro only",
-            font_size=dp(14),
-            italic=True,
-            size_hint_y=None,
-            height=dp(30),
-            halign='center'
-        )
-        self.layout.add_widget(self.color_info)
-        
         # Add more spacing at bottom
-        self.layout.add_widget(BoxLayout(size_hint_y=0.2))
+        self.layout.add_widget(Widget(size_hint_y=0.2))
         
+        # The layout's default size_hint already makes it fill the screen
         self.add_widget(self.layout)
-        
-        # Schedule a delayed layout update
-        Clock.schedule_once(self.update_layout, 0.5)
     
-    def update_layout(self, dt=None):
-        """Update layout when the size changes."""
-        if hasattr(self, 'layout'):
-            self.layout.size = self.size
+    def _on_select(self, tablet_model, instance):
+        """Handle a press on one of the device buttons."""
+        self.select_tablet(tablet_model)
     
     def select_tablet(self, tablet_model):
         """Set the selected tablet model and move to the PDF preview screen."""
         app = App.get_running_app()
+        
+        # The preview is already set up for the current model, so re-selecting it only navigates back
+        if app.has_completed_setup and tablet_model == app.selected_tablet:
+            app.screen_manager.current = 'pdf_preview'
+            return
+        
         # Use a safer approach with a try-except block
         try:
             app.select_tablet(tablet_model)
@@ -175,17 +334,6 @@ class TabletSelectionView(Screen):
                 title='Error',
                 content=Label(text=f"Could not select tablet: {str(e)}"),
                 size_hint=(None, None),
-                size=(dp(400), dp(200))
+                size=(_DP400, _DP200)
             )
             popup.open()
-            
-            # Try again after a delay
-            Clock.schedule_once(lambda dt: self._retry_tablet_selection(tablet_model), 0.5)
-
-    def _retry_tablet_selection(self, tablet_model):
-        """Retry tablet selection after a delay."""
-        app = App.get_running_app()
-        try:
-            app.select_tablet(tablet_model)
-        except Exception as e:
-            print(f"Retry tablet selection also failed: {e}")